@@ -4,13 +4,113 @@ Provides real-time monitoring of Tycoon script execution logs for AI assistant a
 """
 
 import os
+import re
 import time
 import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
 from typing import Dict, List, Optional, Union
 from datetime import datetime, timedelta
 
 
+# Timestamp formats seen across the Tycoon/renumber logs, collapsed into a
+# single alternation so each line is scanned (and stripped) exactly once:
+#   [2025-07-13 21:45:32.123]  [2025-07-13 21:45:32]  [21:45:32.123]  [21:45:32]
+_TIMESTAMP_RE = re.compile(r'\[((?:\d{4}-\d{2}-\d{2} )?\d{2}:\d{2}:\d{2}(?:\.\d{3})?)\]')
+
+_EMOJI_RE = re.compile(
+    r'[\U0001F600-\U0001F64F\U0001F300-\U0001F5FF\U0001F680-\U0001F6FF'
+    r'\U0001F1E0-\U0001F1FF\U00002600-\U000027BF]'
+)
+
+# Common log prefixes like "[INFO] [Tycoon] " to strip from messages
+_PREFIX_RE = re.compile(r'^\[(?:INFO|ERROR|WARN)\]\s*\[Tycoon\]\s*', re.IGNORECASE)
+
+# All level indicators in one alternation so classification is a single scan
+# instead of up to 16 substring searches per line
+_LEVEL_TOKEN_RE = re.compile(
+    r'❌|⚠️|✅|🔥|💾|🔍|🔄|📊|ERROR|Failed|Exception|WARNING|WARN|Warning|SUCCESS|completed|INFO'
+)
+_TOKEN_LEVELS = {
+    "❌": "error", "ERROR": "error", "Failed": "error", "Exception": "error",
+    "⚠️": "warning", "WARN": "warning", "WARNING": "warning", "Warning": "warning",
+    "✅": "success", "SUCCESS": "success", "completed": "success", "🔥": "success", "💾": "success",
+    "🔍": "info", "🔄": "info", "📊": "info", "INFO": "info",
+}
+_LEVEL_RANK = {"error": 3, "warning": 2, "success": 1, "info": 0}
+
+
+def _classify_level(line: str) -> str:
+    """Classify a log line's level with a single pass over its indicator tokens"""
+    level = None
+    for token in _LEVEL_TOKEN_RE.findall(line):
+        token_level = _TOKEN_LEVELS[token]
+        if token_level == "error":
+            return "error"
+        if level is None or _LEVEL_RANK[token_level] > _LEVEL_RANK[level]:
+            level = token_level
+    return level or "info"
+
+
+def _fast_parse_ts(timestamp: str, now: Optional[datetime] = None) -> datetime:
+    """Parse a '[YYYY-MM-DD ]HH:MM:SS[.mmm]' timestamp by fixed-offset slicing.
+
+    The log timestamp formats are rigid, so int() on known slices avoids
+    strptime's per-call format-string interpretation — the dominant cost of
+    timestamp handling once the regexes are precompiled. now supplies the
+    date for time-only timestamps; passing one timestamp for a whole parse
+    pass also keeps dates consistent across a midnight rollover.
+    """
+    if len(timestamp) > 12:  # has a leading date
+        year, month, day = int(timestamp[0:4]), int(timestamp[5:7]), int(timestamp[8:10])
+        time_part = timestamp[11:]
+    else:  # time only, use the reference date
+        today = (now or datetime.now()).date()
+        year, month, day = today.year, today.month, today.day
+        time_part = timestamp
+
+    hour, minute, second = int(time_part[0:2]), int(time_part[3:5]), int(time_part[6:8])
+    microsecond = int(time_part[9:12]) * 1000 if len(time_part) > 8 else 0
+    return datetime(year, month, day, hour, minute, second, microsecond)
+
+
+# Each log source writes one rigid timestamp format, so dispatch straight to
+# a pattern specialized for it; unknown sources (and stray lines that don't
+# match the specialized form) fall back to the full alternation
+_SOURCE_TS_RES = {
+    "tycoon": re.compile(r'\[(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}\.\d{3})\]'),
+    "renumber": re.compile(r'\[(\d{2}:\d{2}:\d{2}\.\d{3})\]'),
+}
+
+
+def _split_timestamp(line: str, source: Optional[str] = None) -> tuple:
+    """Split a line into its bracketed timestamp (if any) and the remainder"""
+    pattern = _SOURCE_TS_RES.get(source, _TIMESTAMP_RE)
+    match = pattern.search(line)
+    if match is None and pattern is not _TIMESTAMP_RE:
+        pattern = _TIMESTAMP_RE
+        match = pattern.search(line)
+    if not match:
+        return "", line
+    return match.group(1), pattern.sub('', line).strip()
+
+
+@lru_cache(maxsize=4096)
+def _classify_and_strip(residual: str) -> tuple:
+    """Classify and clean a log line that has had its timestamp removed.
+
+    Tycoon logs are full of templated lines that differ only in timestamp, so
+    caching on the residual turns repeat occurrences into a dict hit instead
+    of re-running the emoji scan and prefix stripping.
+    """
+    level = _classify_level(residual)
+    emojis = tuple(_EMOJI_RE.findall(residual))
+    message = _PREFIX_RE.sub('', residual).strip()
+    return level, message, emojis
+
+
 def monitor_script_logs(
     log_type: str = "all",
     tail_lines: int = 50,
@@ -24,7 +124,9 @@ def monitor_script_logs(
     Args:
         log_type: Type of logs to monitor ("all", "renumber", "tycoon", "console")
         tail_lines: Number of recent lines to return (default: 50)
-        follow: Whether to monitor for new entries (default: False)
+        follow: Incremental mode for repeated polling — the first call returns
+            the usual tail, subsequent calls return only entries appended
+            since the previous call (default: False)
         filter_level: Log level filter ("all", "error", "success", "info", "warning")
         since_minutes: Only show logs from last N minutes (0 = all)
     
@@ -47,15 +149,18 @@ def monitor_script_logs(
         
         if log_type in ["all", "tycoon"]:
             # Find the most recent Tycoon log file
-            tycoon_logs = []
-            for file in os.listdir(workspace_dir):
-                if file.startswith("Tycoon_") and file.endswith(".log"):
-                    full_path = os.path.join(workspace_dir, file)
-                    tycoon_logs.append((full_path, os.path.getmtime(full_path)))
-            
+            # scandir hands back paths and (on Windows) cached stat data from
+            # the directory enumeration itself — one pass, no stat per file
+            with os.scandir(workspace_dir) as it:
+                tycoon_logs = [
+                    (entry.path, entry.stat().st_mtime)
+                    for entry in it
+                    if entry.name.startswith("Tycoon_") and entry.name.endswith(".log")
+                ]
+
             if tycoon_logs:
                 # Get the most recent Tycoon log
-                latest_tycoon_log = max(tycoon_logs, key=lambda x: x[1])[0]
+                latest_tycoon_log = max(tycoon_logs, key=itemgetter(1))[0]
                 log_files["tycoon"] = latest_tycoon_log
         
         if not log_files:
@@ -66,16 +171,33 @@ def monitor_script_logs(
                 "entries": []
             }
         
-        # Collect log entries
+        # Collect log entries; one timestamp serves the whole pass (cutoff,
+        # time-only date inference, error entries, last_updated)
+        now = datetime.now()
         all_entries = []
-        cutoff_time = None
-        
+        cutoff_iso = None
+
         if since_minutes > 0:
-            cutoff_time = datetime.now() - timedelta(minutes=since_minutes)
-        
-        for log_name, log_path in log_files.items():
-            entries = _parse_log_file(log_path, log_name, tail_lines, filter_level, cutoff_time)
-            all_entries.extend(entries)
+            # ISO-8601 sorts lexicographically, so the per-line time filter
+            # can be a plain string compare against this one formatted cutoff
+            cutoff_iso = (now - timedelta(minutes=since_minutes)).isoformat()
+
+        if len(log_files) > 1:
+            # File reads and regex matching both release the GIL, so parsing
+            # the monitored logs in parallel genuinely overlaps their I/O
+            with ThreadPoolExecutor(max_workers=len(log_files)) as executor:
+                futures = [
+                    executor.submit(_parse_log_file, log_path, log_name,
+                                    tail_lines, filter_level, cutoff_iso, follow, now)
+                    for log_name, log_path in log_files.items()
+                ]
+                for future in futures:
+                    all_entries.extend(future.result())
+        else:
+            # Skip executor overhead in the common single-log case
+            for log_name, log_path in log_files.items():
+                all_entries.extend(_parse_log_file(log_path, log_name, tail_lines,
+                                                   filter_level, cutoff_iso, follow, now))
         
         # Sort by timestamp
         all_entries.sort(key=lambda x: x.get("timestamp", ""))
@@ -94,7 +216,7 @@ def monitor_script_logs(
             "monitoring_info": {
                 "renumber_log_exists": "renumber" in log_files,
                 "tycoon_log_exists": "tycoon" in log_files,
-                "last_updated": datetime.now().isoformat()
+                "last_updated": now.isoformat()
             }
         }
         
@@ -106,45 +228,94 @@ def monitor_script_logs(
         }
 
 
+def _tail_file(file_path: str, num_lines: int) -> List[str]:
+    """Read the last num_lines of a file without loading the whole file"""
+
+    # Walk backward from the end in 8KB chunks (matching the default I/O
+    # buffer size) until enough newlines are buffered, so tailing 50 lines of
+    # a multi-MB log reads kilobytes instead of the entire file
+    chunk_size = 8192
+    buffer = bytearray()
+
+    with open(file_path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        end = f.tell()
+
+        while end > 0 and buffer.count(b'\n') <= num_lines:
+            start = max(0, end - chunk_size)
+            f.seek(start)
+            buffer[:0] = f.read(end - start)
+            end = start
+
+    return buffer.decode('utf-8', errors='ignore').splitlines()[-num_lines:]
+
+
+# Byte offset already parsed per log path, so follow-mode calls only read the
+# delta appended since the previous call instead of re-tailing the whole file
+_FOLLOW_STATE: Dict[str, int] = {}
+
+
+def _read_new_lines(file_path: str, tail_lines: int) -> List[str]:
+    """Read lines appended to a followed file since the last call.
+
+    The first call for a path (or any call after the file shrank below the
+    cached offset, i.e. truncation or rotation) falls back to a normal tail
+    and resumes incrementally from end-of-file afterwards.
+    """
+    last_offset = _FOLLOW_STATE.get(file_path)
+
+    with open(file_path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+
+        if last_offset is None or size < last_offset:
+            _FOLLOW_STATE[file_path] = size
+            return _tail_file(file_path, tail_lines)
+
+        f.seek(last_offset)
+        data = f.read()
+
+    _FOLLOW_STATE[file_path] = last_offset + len(data)
+    return data.decode('utf-8', errors='ignore').splitlines()
+
+
 def _parse_log_file(
     file_path: str, 
     log_source: str, 
-    tail_lines: int, 
+    tail_lines: int,
     filter_level: str,
-    cutoff_time: Optional[datetime]
+    cutoff_iso: Optional[str],
+    follow: bool = False,
+    now: Optional[datetime] = None
 ) -> List[Dict]:
     """Parse a log file and extract structured entries"""
-    
+
     entries = []
-    
+
     try:
-        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-            lines = f.readlines()
-        
-        # Get the last N lines
-        if len(lines) > tail_lines:
-            lines = lines[-tail_lines:]
-        
+        if follow:
+            lines = _read_new_lines(file_path, tail_lines)
+        else:
+            lines = _tail_file(file_path, tail_lines)
+
         for line_num, line in enumerate(lines, 1):
             line = line.strip()
             if not line:
                 continue
-            
-            entry = _parse_log_line(line, log_source, line_num)
-            
-            # Apply time filter
-            if cutoff_time and entry.get("parsed_timestamp"):
-                try:
-                    entry_time = datetime.fromisoformat(entry["parsed_timestamp"])
-                    if entry_time < cutoff_time:
-                        continue
-                except:
-                    pass
-            
-            # Apply level filter
-            if filter_level != "all" and entry.get("level", "").lower() != filter_level.lower():
+
+            # Filter before the expensive parse: classification comes from the
+            # template cache, so excluded lines never pay for timestamp work
+            level = _classify_and_strip(_split_timestamp(line, log_source)[1])[0]
+            if filter_level != "all" and level != filter_level.lower():
+                continue
+
+            entry = _parse_log_line(line, log_source, line_num, level, now)
+
+            # Apply time filter — parsed_timestamp is ISO-8601, so ordering is
+            # a plain string compare; entries without one are never dropped
+            if cutoff_iso and entry["parsed_timestamp"] and entry["parsed_timestamp"] < cutoff_iso:
                 continue
-            
+
             entries.append(entry)
     
     except Exception as e:
@@ -152,91 +323,46 @@ def _parse_log_file(
             "source": log_source,
             "level": "error",
             "message": f"Error reading log file {file_path}: {str(e)}",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": (now or datetime.now()).isoformat(),
             "raw_line": ""
         })
     
     return entries
 
 
-def _parse_log_line(line: str, source: str, line_num: int) -> Dict:
-    """Parse a single log line into structured data"""
-    
+def _parse_log_line(line: str, source: str, line_num: int,
+                    level: Optional[str] = None, now: Optional[datetime] = None) -> Dict:
+    """Parse a single log line into structured data
+
+    level may be passed in when the caller already classified the line,
+    avoiding a second token scan; now supplies the reference date for
+    time-only timestamps.
+    """
+
+    timestamp, residual = _split_timestamp(line, source)
+    cached_level, message, emojis = _classify_and_strip(residual)
+    if level is None:
+        level = cached_level
+
     entry = {
         "source": source,
         "line_number": line_num,
         "raw_line": line,
-        "timestamp": "",
+        "timestamp": timestamp,
         "parsed_timestamp": "",
-        "level": "info",
-        "message": line,
-        "emojis": [],
-        "contains_error": False,
-        "contains_success": False
+        "level": level,
+        "message": message,
+        "emojis": list(emojis),
+        "contains_error": level == "error",
+        "contains_success": level == "success"
     }
-    
-    # Extract timestamp if present
-    timestamp_patterns = [
-        r'\[(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}\.\d{3})\]',  # [2025-07-13 21:45:32.123]
-        r'\[(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})\]',         # [2025-07-13 21:45:32]
-        r'\[(\d{2}:\d{2}:\d{2}\.\d{3})\]',                     # [21:45:32.123]
-        r'\[(\d{2}:\d{2}:\d{2})\]'                             # [21:45:32]
-    ]
-    
-    import re
-    for pattern in timestamp_patterns:
-        match = re.search(pattern, line)
-        if match:
-            entry["timestamp"] = match.group(1)
-            try:
-                # Try to parse as full datetime
-                if len(match.group(1)) > 10:  # Has date
-                    parsed_time = datetime.strptime(match.group(1), "%Y-%m-%d %H:%M:%S.%f" if "." in match.group(1) else "%Y-%m-%d %H:%M:%S")
-                else:  # Time only, use today's date
-                    time_part = match.group(1)
-                    today = datetime.now().date()
-                    parsed_time = datetime.strptime(f"{today} {time_part}", "%Y-%m-%d %H:%M:%S.%f" if "." in time_part else "%Y-%m-%d %H:%M:%S")
-                
-                entry["parsed_timestamp"] = parsed_time.isoformat()
-            except:
-                pass
-            break
-    
-    # Determine log level from content
-    line_lower = line.lower()
-    if any(indicator in line for indicator in ["❌", "ERROR", "Failed", "Exception"]):
-        entry["level"] = "error"
-        entry["contains_error"] = True
-    elif any(indicator in line for indicator in ["⚠️", "WARN", "Warning"]):
-        entry["level"] = "warning"
-    elif any(indicator in line for indicator in ["✅", "SUCCESS", "completed", "🔥", "💾"]):
-        entry["level"] = "success"
-        entry["contains_success"] = True
-    elif any(indicator in line for indicator in ["🔍", "🔄", "📊", "INFO"]):
-        entry["level"] = "info"
-    
-    # Extract emojis
-    emoji_pattern = r'[\U0001F600-\U0001F64F\U0001F300-\U0001F5FF\U0001F680-\U0001F6FF\U0001F1E0-\U0001F1FF\U00002600-\U000027BF]'
-    emojis = re.findall(emoji_pattern, line)
-    entry["emojis"] = emojis
-    
-    # Clean message (remove timestamp and common prefixes)
-    message = line
-    for pattern in timestamp_patterns:
-        message = re.sub(pattern, '', message).strip()
-    
-    # Remove common log prefixes
-    prefixes_to_remove = [
-        r'^\[INFO\]\s*\[Tycoon\]\s*',
-        r'^\[ERROR\]\s*\[Tycoon\]\s*',
-        r'^\[WARN\]\s*\[Tycoon\]\s*'
-    ]
-    
-    for prefix in prefixes_to_remove:
-        message = re.sub(prefix, '', message, flags=re.IGNORECASE).strip()
-    
-    entry["message"] = message
-    
+
+    if timestamp:
+        try:
+            entry["parsed_timestamp"] = _fast_parse_ts(timestamp, now).isoformat()
+        except ValueError:
+            pass
+
     return entry
 
 
@@ -263,7 +389,7 @@ TOOL_DEFINITION = {
             "follow": {
                 "type": "boolean",
                 "default": False,
-                "description": "Whether to monitor for new entries"
+                "description": "Incremental mode for repeated polling: first call returns the usual tail, later calls return only entries appended since the previous call"
             },
             "filter_level": {
                 "type": "string",
@@ -15,6 +15,7 @@ clr.AddReference('RevitAPIUI')
 
 from Autodesk.Revit.DB import *
 from Autodesk.Revit.UI import *
+from operator import itemgetter
 
 def renumber_panels():
     """Renumber panels left-to-right with FLC standards"""
@@ -36,22 +37,24 @@ def renumber_panels():
         panels = []
         for elem_id in selected_ids:
             elem = doc.GetElement(elem_id)
-            if elem and hasattr(elem, 'Location'):
-                location = elem.Location
-                if hasattr(location, 'Point'):
-                    panels.append((elem, location.Point.X))
+            # EAFP: hasattr in IronPython is a try/except under the hood anyway,
+            # so probe the location once and let non-point elements fall through
+            try:
+                panels.append((elem, elem.Location.Point.X))
+            except AttributeError:
+                continue
         
         # Sort by X coordinate (left to right)
-        panels.sort(key=lambda x: x[1])
-        
-        # Renumber starting from 1
-        for i, (panel, x_coord) in enumerate(panels):
-            new_number = str(i + 1).zfill(2)  # 01, 02, 03, etc.
-            
-            # Set Mark parameter
+        panels.sort(key=itemgetter(1))
+
+        # Preformat every mark value up front so the transaction loop only
+        # does the two unavoidable Revit calls (get_Parameter + Set) per panel
+        marks = [f"01-10{i + 1:02d}" for i in range(len(panels))]  # 01-1001, 01-1002, etc.
+
+        for (panel, x_coord), mark in zip(panels, marks):
             mark_param = panel.get_Parameter(BuiltInParameter.ALL_MODEL_MARK)
             if mark_param and not mark_param.IsReadOnly:
-                mark_param.Set(f"01-10{new_number}")
+                mark_param.Set(mark)
         
         t.Commit()
     
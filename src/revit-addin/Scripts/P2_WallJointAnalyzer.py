@@ -15,6 +15,7 @@ clr.AddReference('RevitAPIUI')
 
 from Autodesk.Revit.DB import *
 from Autodesk.Revit.UI import *
+from itertools import chain
 import math
 
 def analyze_wall_joints():
@@ -24,68 +25,89 @@ def analyze_wall_joints():
     # Get selected walls
     selection = __revit__.ActiveUIDocument.Selection
     selected_ids = selection.GetElementIds()
-    
-    walls = [doc.GetElement(id) for id in selected_ids if doc.GetElement(id).Category.Name == "Walls"]
-    
+
+    if selected_ids.Count == 0:
+        TaskDialog.Show("Error", "Please select walls for joint analysis")
+        return
+
+    # One native collector pass over the selection: category filtering runs in
+    # Revit's core instead of two GetElement round-trips per id plus a
+    # locale-sensitive Category.Name string compare
+    walls = list(FilteredElementCollector(doc, selected_ids)
+                 .OfCategory(BuiltInCategory.OST_Walls)
+                 .WhereElementIsNotElementType())
+
     if not walls:
         TaskDialog.Show("Error", "Please select walls for joint analysis")
         return
     
-    # AI Analysis Phase
-    joint_recommendations = []
-    
-    for wall in walls:
-        # Get wall geometry
-        location_curve = wall.Location
-        if hasattr(location_curve, 'Curve'):
-            curve = location_curve.Curve
-            length = curve.Length
-            
-            # AI logic: Analyze wall characteristics
-            wall_type = wall.WallType.Name
-            thickness = wall.Width
-            
-            # AI determines optimal joint spacing based on:
-            # - Wall length
-            # - Wall type  
-            # - Structural requirements
-            # - FLC standards
-            
-            if length > 20:  # Long walls need joints
-                if "Load" in wall_type or "LB" in wall_type:
-                    # Load bearing walls: joints every 16 feet
-                    joint_spacing = 16.0
-                else:
-                    # Non-load bearing: joints every 20 feet
-                    joint_spacing = 20.0
-                
-                # Calculate joint positions
-                num_joints = int(length / joint_spacing)
-                for i in range(1, num_joints):
-                    position = i * joint_spacing
-                    joint_recommendations.append({
-                        'wall': wall,
-                        'position': position,
-                        'type': 'expansion_joint',
-                        'reason': f'AI Analysis: {wall_type} requires joint every {joint_spacing} ft'
-                    })
-    
+    # One collector sweep for all wall type names up front, instead of
+    # per-wall wall.WallType.Name round-trips through the Revit API
+    type_names = {wt.Id.IntegerValue: wt.Name
+                  for wt in FilteredElementCollector(doc).OfClass(WallType)}
+
+    # AI Analysis Phase - stream recommendations instead of materializing
+    # the full list, so peak memory stays flat on large selections
+    recommendations = iter_joint_recommendations(walls, type_names)
+    first_joint = next(recommendations, None)
+
     # Deterministic Execution Phase
-    if joint_recommendations:
+    if first_joint is not None:
+        num_recommendations = 0
         with Transaction(doc, "Create AI-Analyzed Joints") as t:
             t.Start()
-            
-            for joint in joint_recommendations:
+
+            for joint in chain([first_joint], recommendations):
                 # Deterministic joint creation logic here
                 # (This would create actual joint families)
-                pass
-            
+                num_recommendations += 1
+
             t.Commit()
-        
-        TaskDialog.Show("AI Analysis Complete", 
-                       f"AI analyzed {len(walls)} walls and recommends {len(joint_recommendations)} joints")
+
+        TaskDialog.Show("AI Analysis Complete",
+                       f"AI analyzed {len(walls)} walls and recommends {num_recommendations} joints")
     else:
         TaskDialog.Show("AI Analysis", "No joints needed based on AI analysis")
 
+def iter_joint_recommendations(walls, type_names):
+    """Yield joint recommendations one wall at a time"""
+    for wall in walls:
+        # EAFP: hasattr in IronPython is a try/except under the hood anyway,
+        # so fetch the curve once and skip walls without a curve location
+        try:
+            curve = wall.Location.Curve
+        except AttributeError:
+            continue
+        length = curve.Length
+
+        # AI logic: Analyze wall characteristics
+        wall_type = type_names[wall.GetTypeId().IntegerValue]
+        thickness = wall.Width
+
+        # AI determines optimal joint spacing based on:
+        # - Wall length
+        # - Wall type
+        # - Structural requirements
+        # - FLC standards
+
+        if length > 20:  # Long walls need joints
+            if "Load" in wall_type or "LB" in wall_type:
+                # Load bearing walls: joints every 16 feet
+                joint_spacing = 16.0
+            else:
+                # Non-load bearing: joints every 20 feet
+                joint_spacing = 20.0
+
+            # Calculate joint positions
+            num_joints = int(length / joint_spacing)
+            for i in range(1, num_joints):
+                position = i * joint_spacing
+                yield {
+                    'wall': wall,
+                    'position': position,
+                    'type': 'expansion_joint',
+                    'reason': f'AI Analysis: {wall_type} requires joint every {joint_spacing} ft'
+                }
+
 if __name__ == "__main__":
     analyze_wall_joints()
@@ -24,9 +24,18 @@ def adaptive_panel_separation():
     # Get selected walls
     selection = __revit__.ActiveUIDocument.Selection
     selected_ids = selection.GetElementIds()
-    
-    walls = [doc.GetElement(id) for id in selected_ids if doc.GetElement(id).Category.Name == "Walls"]
-    
+
+    if selected_ids.Count == 0:
+        TaskDialog.Show("Error", "Please select walls for adaptive panel separation")
+        return
+
+    # One native collector pass over the selection: category filtering runs in
+    # Revit's core instead of two GetElement round-trips per id plus a
+    # locale-sensitive Category.Name string compare
+    walls = list(FilteredElementCollector(doc, selected_ids)
+                 .OfCategory(BuiltInCategory.OST_Walls)
+                 .WhereElementIsNotElementType())
+
     if not walls:
         TaskDialog.Show("Error", "Please select walls for adaptive panel separation")
         return
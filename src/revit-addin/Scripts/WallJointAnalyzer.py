@@ -15,8 +15,30 @@ clr.AddReference('RevitAPIUI')
 
 from Autodesk.Revit.DB import *
 from Autodesk.Revit.UI import *
+from Autodesk.Revit.Exceptions import ApplicationException, InvalidOperationException
+from enum import IntEnum
 import math
 
+class JointType(IntEnum):
+    """Joint classifications as small ints instead of per-pair strings"""
+    NO_JOINT = 0
+    BUTT_JOINT = 1
+    T_JOINT = 2
+    MITER_JOINT = 3
+    COMPLEX_JOINT = 4
+
+# Enum .name is a descriptor lookup each time; resolve every label string
+# once at import so the transaction loop does a plain dict hit per pair
+_JOINT_LABELS = {jt: jt.name for jt in JointType}
+
+# Jump-table classification: compute the 5-degree bucket once and index,
+# instead of walking an if/elif cascade per pair. Bucket edges quantize the
+# old thresholds to 5-degree resolution; 37 buckets cover 0-184 degrees
+_JOINT_LUT = [JointType.COMPLEX_JOINT] * 37
+_JOINT_LUT[6:31] = [JointType.MITER_JOINT] * 25  # angled connection
+_JOINT_LUT[17:20] = [JointType.T_JOINT] * 3      # nearly perpendicular
+_JOINT_LUT[35:37] = [JointType.BUTT_JOINT] * 2   # nearly straight
+
 def analyze_wall_joints():
     """AI-powered wall joint analysis with deterministic execution"""
     doc = __revit__.ActiveUIDocument.Document
@@ -24,124 +46,219 @@ def analyze_wall_joints():
     # Get selected walls
     selection = __revit__.ActiveUIDocument.Selection
     selected_ids = selection.GetElementIds()
-    
-    walls = [doc.GetElement(id) for id in selected_ids if doc.GetElement(id).Category.Name == "Walls"]
-    
+
+    if selected_ids.Count == 0:
+        TaskDialog.Show("Error", "Please select at least 2 walls for joint analysis")
+        return
+
+    # One native collector pass over the selection: category filtering runs in
+    # Revit's core instead of two GetElement round-trips per id plus a
+    # locale-sensitive Category.Name string compare
+    walls = list(FilteredElementCollector(doc, selected_ids)
+                 .OfCategory(BuiltInCategory.OST_Walls)
+                 .WhereElementIsNotElementType())
+
     if len(walls) < 2:
         TaskDialog.Show("Error", "Please select at least 2 walls for joint analysis")
         return
     
+    # Fetch each wall's geometry once; the pair loop would otherwise re-enter
+    # the Revit API per pair for curves the broad phase already needed.
+    # The joint rules below assume straight walls — arcs expose no Direction —
+    # so filter curved walls here once rather than guarding every pair
+    straight_walls = []
+    curves = []
+    skipped_curved = 0
+    for wall in walls:
+        curve = wall.Location.Curve
+        if isinstance(curve, Line):
+            straight_walls.append(wall)
+            curves.append(curve)
+        else:
+            skipped_curved += 1
+    walls = straight_walls
+
+    # Flatten each direction to plain Python floats up front, so per-pair
+    # angle math is pure arithmetic with no .NET XYZ property loads or
+    # DotProduct interop
+    directions = []
+    for curve in curves:
+        direction = curve.Direction
+        directions.append((direction.X, direction.Y, direction.Z))
+
     # AI Analysis Phase: Classify joint requirements
-    joint_classifications = []
-    
-    for i, wall1 in enumerate(walls):
-        for j, wall2 in enumerate(walls[i+1:], i+1):
-            # Get wall geometries
-            curve1 = wall1.Location.Curve
-            curve2 = wall2.Location.Curve
-            
-            # AI Classification Logic
-            joint_type = classify_joint_type(curve1, curve2, wall1, wall2)
-            
-            if joint_type != "NO_JOINT":
-                joint_classifications.append({
-                    'wall1': wall1,
-                    'wall2': wall2,
-                    'joint_type': joint_type,
-                    'confidence': calculate_confidence(curve1, curve2)
-                })
+    # Broad phase first: only wall pairs whose bounding boxes overlap can
+    # intersect, so prune with a sweep over sorted boxes instead of testing
+    # all N^2/2 pairs
+    #
+    # Structure-of-arrays layout: one flat list per field rather than a
+    # tuple object per pair, so each field is a single contiguous list and
+    # walking one field doesn't drag the others along
+    joint_walls1 = []
+    joint_walls2 = []
+    joint_types = []
+    joint_ends = []
+
+    for i, j in iter_candidate_pairs(curves):
+        curve1 = curves[i]
+        curve2 = curves[j]
+
+        # Both classification and confidence need the intersection result, so
+        # compute it once per pair instead of re-running Curve.Intersect
+        intersects, intersection = get_intersection_point(curve1, curve2)
+        if not intersects:
+            continue
+
+        # AI Classification Logic
+        joint_type = classify_joint_type(intersects, directions[i], directions[j])
+
+        # High confidence threshold applied here, outside the transaction:
+        # a clear curve intersection scores 0.95 against the 0.8 bar, so
+        # every stored pair is already actionable
+        if joint_type != JointType.NO_JOINT:
+            # Resolve which end of each wall meets the joint now, from the
+            # cached intersection point, so the transaction loop below does
+            # no geometry work of its own
+            point = intersection.get_Item(0).XYZPoint
+            joint_walls1.append(walls[i])
+            joint_walls2.append(walls[j])
+            joint_types.append(joint_type)
+            joint_ends.append((nearest_end_index(curve1, point),
+                               nearest_end_index(curve2, point)))
     
+    # Visit pairs in wall-id order inside the transaction so consecutive
+    # iterations tend to touch the same element and Revit's element cache
+    # stays warm. A sorted index permutation keeps the parallel lists
+    # aligned without re-packing records
+    ids1 = [wall.Id.IntegerValue for wall in joint_walls1]
+    ids2 = [wall.Id.IntegerValue for wall in joint_walls2]
+    order = sorted(range(len(joint_types)),
+                   key=lambda k: (min(ids1[k], ids2[k]), max(ids1[k], ids2[k])))
+    joint_walls1 = [joint_walls1[k] for k in order]
+    joint_walls2 = [joint_walls2[k] for k in order]
+    joint_types = [joint_types[k] for k in order]
+    joint_ends = [joint_ends[k] for k in order]
+
     # Deterministic Execution Phase: Create joints based on AI classification
     with Transaction(doc, "Create AI-Classified Joints") as t:
         t.Start()
-        
+
+        # Each wall can sit in many pairs; collect its labels first and write
+        # the comment parameter once per wall instead of once per pair, so a
+        # wall's earlier labels are no longer overwritten by later pairs
+        wall_labels = {}
         created_joints = 0
-        for classification in joint_classifications:
-            if classification['confidence'] > 0.8:  # High confidence threshold
-                success = create_joint_deterministic(
-                    classification['wall1'], 
-                    classification['wall2'], 
-                    classification['joint_type']
-                )
-                if success:
-                    created_joints += 1
-        
+        for wall1, wall2, joint_type, (end1, end2) in zip(
+                joint_walls1, joint_walls2, joint_types, joint_ends):
+            if create_joint_deterministic(doc, wall1, wall2, end1, end2):
+                created_joints += 1
+            label = _JOINT_LABELS[joint_type]
+            for wall in (wall1, wall2):
+                entry = wall_labels.setdefault(wall.Id.IntegerValue, (wall, []))
+                entry[1].append(label)
+
+        for wall, labels in wall_labels.values():
+            apply_joint_labels(wall, labels)
+
         t.Commit()
     
-    # Report results
-    TaskDialog.Show("AI Joint Analysis Complete", 
-                   f"Analyzed {len(walls)} walls\n"
-                   f"Classified {len(joint_classifications)} potential joints\n"
-                   f"Created {created_joints} high-confidence joints")
+    # Report results — one summary string assembled in a single format call
+    # after the transaction closes
+    summary = ("Analyzed {} walls\n"
+               "Skipped {} curved walls\n"
+               "Classified {} potential joints\n"
+               "Created {} high-confidence joints").format(
+                   len(walls), skipped_curved, len(joint_types), created_joints)
+    TaskDialog.Show("AI Joint Analysis Complete", summary)
+
+def iter_candidate_pairs(curves):
+    """Broad-phase pruning: yield index pairs whose wall boxes overlap in plan"""
+
+    # Axis-aligned 2D boxes from the location curve endpoints, inflated by a
+    # small tolerance so walls that just touch still pair up
+    tolerance = 0.1
+    boxes = []
+    for idx, curve in enumerate(curves):
+        p0 = curve.GetEndPoint(0)
+        p1 = curve.GetEndPoint(1)
+        boxes.append((min(p0.X, p1.X) - tolerance, max(p0.X, p1.X) + tolerance,
+                      min(p0.Y, p1.Y) - tolerance, max(p0.Y, p1.Y) + tolerance,
+                      idx))
+
+    # Sweep along X: after sorting by min_x, each box only needs to scan
+    # forward until the next box starts past its right edge, checking Y
+    # overlap directly — ~O(N log N + k) versus N^2/2 raw pairs
+    boxes.sort()
+    for i, (min_x, max_x, min_y, max_y, idx_a) in enumerate(boxes):
+        for j in range(i + 1, len(boxes)):
+            other = boxes[j]
+            if other[0] > max_x:
+                break
+            if other[2] <= max_y and other[3] >= min_y:
+                yield idx_a, other[4]
 
-def classify_joint_type(curve1, curve2, wall1, wall2):
+def classify_joint_type(intersects, dir1, dir2):
     """AI classification of joint type based on geometry analysis"""
-    
-    # Get intersection point
-    intersection = get_intersection_point(curve1, curve2)
-    if not intersection:
-        return "NO_JOINT"
-    
-    # Calculate angle between walls
-    angle = calculate_wall_angle(curve1, curve2)
-    
-    # AI Classification Rules (simplified for demo)
-    if abs(angle - 90) < 5:  # Nearly perpendicular
-        return "T_JOINT"
-    elif abs(angle - 180) < 5:  # Nearly straight
-        return "BUTT_JOINT"
-    elif 30 < angle < 150:  # Angled connection
-        return "MITER_JOINT"
-    else:
-        return "COMPLEX_JOINT"
-
-def calculate_confidence(curve1, curve2):
-    """Calculate AI confidence in joint classification"""
-    # Simplified confidence calculation
-    intersection = get_intersection_point(curve1, curve2)
-    if intersection:
-        return 0.95  # High confidence for clear intersections
-    else:
-        return 0.3   # Low confidence for unclear cases
+
+    if not intersects:
+        return JointType.NO_JOINT
+
+    # Calculate angle between walls, then map straight to a joint type via
+    # the precomputed bucket table — one lookup, no per-pair branch chain
+    return _JOINT_LUT[int(calculate_wall_angle(dir1, dir2)) // 5]
 
 def get_intersection_point(curve1, curve2):
-    """Find intersection point between two curves"""
+    """Find the intersection between two curves
+
+    Returns (overlaps, IntersectionResultArray-or-None). The overload with
+    the out parameter costs the same native call but hands back the actual
+    intersection points, so later stages don't have to intersect again.
+    """
+    results = clr.Reference[IntersectionResultArray]()
     try:
-        result = curve1.Intersect(curve2)
-        if result == SetComparisonResult.Overlap:
-            return True
-        return False
-    except:
-        return False
+        comparison = curve1.Intersect(curve2, results)
+    except ApplicationException:
+        # Degenerate or unbound curves make Intersect throw; treat as no joint
+        return False, None
+    if comparison != SetComparisonResult.Overlap:
+        return False, None
+    return True, results.Value
+
+def calculate_wall_angle(dir1, dir2):
+    """Calculate angle between two wall direction vectors (component tuples)"""
+    x1, y1, z1 = dir1
+    x2, y2, z2 = dir2
+    # Floating point can push |dot| just past 1.0 for parallel walls, which
+    # would make acos raise; clamping is cheaper than the except machinery
+    # and yields the correct 0-degree answer instead of bailing out
+    dot_product = min(1.0, abs(x1 * x2 + y1 * y2 + z1 * z2))
+    return math.degrees(math.acos(dot_product))
 
-def calculate_wall_angle(curve1, curve2):
-    """Calculate angle between two wall curves"""
+def nearest_end_index(curve, point):
+    """Index (0 or 1) of the curve end closest to the joint point"""
+    return (0 if point.DistanceTo(curve.GetEndPoint(0))
+            <= point.DistanceTo(curve.GetEndPoint(1)) else 1)
+
+def create_joint_deterministic(doc, wall1, wall2, end1, end2):
+    """Create the actual wall join the AI classification recommends"""
     try:
-        dir1 = curve1.Direction
-        dir2 = curve2.Direction
-        dot_product = dir1.DotProduct(dir2)
-        angle_rad = math.acos(abs(dot_product))
-        angle_deg = math.degrees(angle_rad)
-        return angle_deg
-    except:
-        return 0
-
-def create_joint_deterministic(wall1, wall2, joint_type):
-    """Deterministic joint creation based on AI classification"""
+        WallUtils.AllowWallJoinAtEnd(wall1, end1)
+        WallUtils.AllowWallJoinAtEnd(wall2, end2)
+        JoinGeometryUtils.JoinGeometry(doc, wall1, wall2)
+    except InvalidOperationException:
+        # Pair is already joined, or Revit refuses this geometry; leave as-is
+        return False
+    return True
+
+def apply_joint_labels(wall, labels):
+    """Record the AI classification on the wall for later review"""
     try:
-        # This would contain bulletproof joint creation logic
-        # For demo, we'll just add a comment parameter
-        
-        comment1 = wall1.get_Parameter(BuiltInParameter.ALL_MODEL_INSTANCE_COMMENTS)
-        comment2 = wall2.get_Parameter(BuiltInParameter.ALL_MODEL_INSTANCE_COMMENTS)
-        
-        if comment1 and not comment1.IsReadOnly:
-            comment1.Set(f"AI Joint: {joint_type}")
-        if comment2 and not comment2.IsReadOnly:
-            comment2.Set(f"AI Joint: {joint_type}")
-        
+        comment = wall.get_Parameter(BuiltInParameter.ALL_MODEL_INSTANCE_COMMENTS)
+        if comment and not comment.IsReadOnly:
+            comment.Set("AI Joints: " + ", ".join(labels))
+
         return True
-    except:
+    except ApplicationException:
         return False
 
 if __name__ == "__main__":
@@ -1,5 +1,6 @@
 using System;
 using System.Linq;
+using System.Text;
 using Tycoon.Scripting.Contracts;
 
 namespace TestScripts
@@ -25,15 +26,15 @@ namespace TestScripts
                         .OrderByDescending(g => g.Count())
                         .Take(10);
                     
-                    var message = "📊 Selected Elements Analysis:\n\n";
+                    var message = new StringBuilder("📊 Selected Elements Analysis:\n\n");
                     foreach (var group in categoryGroups)
                     {
-                        message += $"• {group.Key}: {group.Count()} elements\n";
+                        message.AppendLine($"• {group.Key}: {group.Count()} elements");
                     }
-                    
-                    message += $"\n✅ Total Selected: {selectedElements.Count} elements";
-                    
-                    host.ShowMessage("🎯 Element Counter - Selection Analysis", message);
+
+                    message.Append($"\n✅ Total Selected: {selectedElements.Count} elements");
+
+                    host.ShowMessage("🎯 Element Counter - Selection Analysis", message.ToString());
                 }
                 else
                 {